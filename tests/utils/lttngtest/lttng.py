@@ -7,8 +7,8 @@
 
 from . import lttngctl, logger, environment
 import os
-from typing import Callable, Optional, Type, Union, Iterator
-import shlex
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional, Type, Union, Iterator
 import subprocess
 import enum
 import xml.etree.ElementTree
@@ -36,15 +36,27 @@ class ChannelNotFound(lttngctl.ControlException):
         super().__init__(msg)
 
 
-def _get_domain_option_name(domain):
-    # type: (lttngctl.TracingDomain) -> str
-    return {
+_DOMAIN_OPTION = MappingProxyType(
+    {
         lttngctl.TracingDomain.User: "userspace",
         lttngctl.TracingDomain.Kernel: "kernel",
         lttngctl.TracingDomain.Log4j: "log4j",
         lttngctl.TracingDomain.Python: "python",
         lttngctl.TracingDomain.JUL: "jul",
-    }[domain]
+    }
+)  # type: Mapping[lttngctl.TracingDomain, str]
+
+
+def _get_domain_option_name(domain):
+    # type: (lttngctl.TracingDomain) -> str
+    try:
+        return _DOMAIN_OPTION[domain]
+    except KeyError:
+        raise Unsupported(
+            "Tracing domain `{domain}` is not supported by the LTTng client".format(
+                domain=domain
+            )
+        )
 
 
 def _get_domain_xml_mi_name(domain):
@@ -58,22 +70,28 @@ def _get_domain_xml_mi_name(domain):
     }[domain]
 
 
+_CONTEXT_TYPE_NAME = MappingProxyType(
+    {
+        lttngctl.VgidContextType: "vgid",
+        lttngctl.VuidContextType: "vuid",
+        lttngctl.VpidContextType: "vpid",
+    }
+)  # type: Mapping[type, str]
+
+
 def _get_context_type_name(context):
     # type: (lttngctl.ContextType) -> str
-    if isinstance(context, lttngctl.VgidContextType):
-        return "vgid"
-    elif isinstance(context, lttngctl.VuidContextType):
-        return "vuid"
-    elif isinstance(context, lttngctl.VpidContextType):
-        return "vpid"
-    elif isinstance(context, lttngctl.JavaApplicationContextType):
+    if isinstance(context, lttngctl.JavaApplicationContextType):
         return "$app.{retriever}:{field}".format(
             retriever=context.retriever_name, field=context.field_name
         )
-    else:
+
+    try:
+        return _CONTEXT_TYPE_NAME[type(context)]
+    except KeyError:
         raise Unsupported(
             "Context `{context_name}` is not supported by the LTTng client".format(
-                type(context).__name__
+                context_name=type(context).__name__
             )
         )
 
@@ -189,7 +207,28 @@ def _get_tracepoint_event_rule_class_from_domain_type(domain_type):
     }[domain_type]
 
 
+_TRACEPOINT_DOMAIN = MappingProxyType(
+    {
+        lttngctl.UserTracepointEventRule: "userspace",
+        lttngctl.KernelTracepointEventRule: "kernel",
+        lttngctl.Log4jTracepointEventRule: "log4j",
+        lttngctl.JULTracepointEventRule: "jul",
+        lttngctl.PythonTracepointEventRule: "python",
+    }
+)  # type: Mapping[type, str]
+
+
+_LOGLEVEL_FLAG = MappingProxyType(
+    {
+        lttngctl.LogLevelRuleAsSevereAs: "--loglevel",
+        lttngctl.LogLevelRuleExactly: "--loglevel-only",
+    }
+)  # type: Mapping[type, str]
+
+
 class _Channel(lttngctl.Channel):
+    __slots__ = ("_client", "_name", "_domain", "_session")
+
     def __init__(
         self,
         client,  # type: LTTngClient
@@ -207,71 +246,68 @@ class _Channel(lttngctl.Channel):
         domain_option_name = _get_domain_option_name(self.domain)
         context_type_name = _get_context_type_name(context_type)
         self._client._run_cmd(
-            "add-context --{domain_option_name} --channel '{channel_name}' --type {context_type_name}".format(
-                domain_option_name=domain_option_name,
-                channel_name=self.name,
-                context_type_name=context_type_name,
-            )
+            [
+                "add-context",
+                "--" + domain_option_name,
+                "--channel",
+                self.name,
+                "--type",
+                context_type_name,
+            ]
         )
 
     def add_recording_rule(self, rule):
         # type: (Type[lttngctl.EventRule]) -> None
-        client_args = (
-            "enable-event --session {session_name} --channel {channel_name}".format(
-                session_name=self._session.name, channel_name=self.name
-            )
-        )
-        if isinstance(rule, lttngctl.TracepointEventRule):
-            domain_option_name = (
-                "userspace"
-                if isinstance(rule, lttngctl.UserTracepointEventRule)
-                else "kernel"
-            )
-            client_args = client_args + " --{domain_option_name}".format(
-                domain_option_name=domain_option_name
+        client_args = [
+            "enable-event",
+            "--session",
+            self._session.name,
+            "--channel",
+            self.name,
+        ]  # type: list[str]
+        try:
+            domain_option_name = _TRACEPOINT_DOMAIN[type(rule)]
+        except KeyError:
+            raise Unsupported(
+                "event rule type `{event_rule_type}` is unsupported by LTTng client".format(
+                    event_rule_type=type(rule).__name__
+                )
             )
 
-            if rule.name_pattern:
-                client_args = client_args + " " + rule.name_pattern
-            else:
-                client_args = client_args + " --all"
-
-            if rule.filter_expression:
-                client_args = client_args + " " + rule.filter_expression
+        client_args.append("--" + domain_option_name)
 
-            if rule.log_level_rule:
-                if isinstance(rule.log_level_rule, lttngctl.LogLevelRuleAsSevereAs):
-                    client_args = client_args + " --loglevel {log_level}".format(
-                        log_level=_get_log_level_argument_name(
-                            rule.log_level_rule.level
-                        )
-                    )
-                elif isinstance(rule.log_level_rule, lttngctl.LogLevelRuleExactly):
-                    client_args = client_args + " --loglevel-only {log_level}".format(
-                        log_level=_get_log_level_argument_name(
-                            rule.log_level_rule.level
-                        )
-                    )
-                else:
-                    raise Unsupported(
-                        "Unsupported log level rule type `{log_level_rule_type}`".format(
-                            log_level_rule_type=type(rule.log_level_rule).__name__
-                        )
-                    )
-
-            if rule.name_pattern_exclusions:
-                client_args = client_args + " --exclude "
-                for idx, pattern in enumerate(rule.name_pattern_exclusions):
-                    if idx != 0:
-                        client_args = client_args + ","
-                    client_args = client_args + pattern
+        if rule.name_pattern:
+            client_args.append(rule.name_pattern)
         else:
-            raise Unsupported(
-                "event rule type `{event_rule_type}` is unsupported by LTTng client".format(
-                    event_rule_type=type(rule).__name__
+            client_args.append("--all")
+
+        if rule.filter_expression:
+            client_args.extend(["--filter", rule.filter_expression])
+
+        # Kernel tracepoint event rules have neither a log level rule nor
+        # name pattern exclusions.
+        log_level_rule = getattr(rule, "log_level_rule", None)
+        if log_level_rule:
+            try:
+                log_level_option_name = _LOGLEVEL_FLAG[type(log_level_rule)]
+            except KeyError:
+                raise Unsupported(
+                    "Unsupported log level rule type `{log_level_rule_type}`".format(
+                        log_level_rule_type=type(log_level_rule).__name__
+                    )
                 )
+
+            client_args.extend(
+                [
+                    log_level_option_name,
+                    _get_log_level_argument_name(log_level_rule.level),
+                ]
             )
 
+        name_pattern_exclusions = getattr(rule, "name_pattern_exclusions", None)
+        if name_pattern_exclusions:
+            client_args.extend(["--exclude", ",".join(name_pattern_exclusions)])
+
         self._client._run_cmd(client_args)
 
     @property
@@ -288,8 +324,7 @@ class _Channel(lttngctl.Channel):
     def recording_rules(self):
         # type: () -> Iterator[lttngctl.EventRule]
         list_session_xml = self._client._run_cmd(
-            "list '{session_name}'".format(session_name=self._session.name),
-            LTTngClient.CommandOutputFormat.MI_XML,
+            ["list", self._session.name], LTTngClient.CommandOutputFormat.MI_XML
         )
 
         root = xml.etree.ElementTree.fromstring(list_session_xml)
@@ -407,19 +442,39 @@ class _ProcessAttribute(enum.Enum):
         return "<%s.%s>" % (self.__class__.__name__, self.name)
 
 
-def _get_process_attribute_option_name(attribute):
-    # type: (_ProcessAttribute) -> str
-    return {
+_PROC_ATTR_OPTION = MappingProxyType(
+    {
         _ProcessAttribute.PID: "pid",
         _ProcessAttribute.VPID: "vpid",
         _ProcessAttribute.UID: "uid",
         _ProcessAttribute.VUID: "vuid",
         _ProcessAttribute.GID: "gid",
         _ProcessAttribute.VGID: "vgid",
-    }[attribute]
+    }
+)  # type: Mapping[_ProcessAttribute, str]
+
+
+def _get_process_attribute_option_name(attribute):
+    # type: (_ProcessAttribute) -> str
+    try:
+        return _PROC_ATTR_OPTION[attribute]
+    except KeyError:
+        raise Unsupported(
+            "Process attribute `{attribute}` is not supported by the LTTng client".format(
+                attribute=attribute
+            )
+        )
 
 
 class _ProcessAttributeTracker(lttngctl.ProcessAttributeTracker):
+    __slots__ = (
+        "_client",
+        "_tracked_attribute",
+        "_domain",
+        "_session",
+        "_allowed_value_types",
+    )
+
     def __init__(
         self,
         client,  # type: LTTngClient
@@ -451,13 +506,14 @@ class _ProcessAttributeTracker(lttngctl.ProcessAttributeTracker):
         )
         domain_name = _get_domain_option_name(self._domain)
         self._client._run_cmd(
-            "{cmd_name} --session '{session_name}' --{domain_name} --{tracked_attribute_name} {value}".format(
-                cmd_name=cmd_name,
-                session_name=self._session.name,
-                domain_name=domain_name,
-                tracked_attribute_name=process_attribute_option_name,
-                value=value,
-            )
+            [
+                cmd_name,
+                "--session",
+                self._session.name,
+                "--" + domain_name,
+                "--" + process_attribute_option_name,
+                str(value),
+            ]
         )
 
     def track(self, value):
@@ -470,6 +526,8 @@ class _ProcessAttributeTracker(lttngctl.ProcessAttributeTracker):
 
 
 class _Session(lttngctl.Session):
+    __slots__ = ("_client", "_name", "_output", "_trackers")
+
     def __init__(
         self,
         client,  # type: LTTngClient
@@ -479,6 +537,9 @@ class _Session(lttngctl.Session):
         self._client = client  # type: LTTngClient
         self._name = name  # type: str
         self._output = output  # type: Optional[lttngctl.SessionOutputLocation]
+        self._trackers = (
+            {}
+        )  # type: dict[tuple[_ProcessAttribute, lttngctl.TracingDomain], _ProcessAttributeTracker]
 
     @property
     def name(self):
@@ -492,19 +553,23 @@ class _Session(lttngctl.Session):
         buffer_sharing_policy=lttngctl.BufferSharingPolicy.PerUID,
     ):
         # type: (lttngctl.TracingDomain, Optional[str], lttngctl.BufferSharingPolicy) -> lttngctl.Channel
-        channel_name = lttngctl.Channel._generate_name()
+        channel_name = (
+            channel_name if channel_name else lttngctl.Channel._generate_name()
+        )
         domain_option_name = _get_domain_option_name(domain)
         self._client._run_cmd(
-            "enable-channel --session '{session_name}' --{domain_name} '{channel_name}' {buffer_sharing_policy}".format(
-                session_name=self.name,
-                domain_name=domain_option_name,
-                channel_name=channel_name,
-                buffer_sharing_policy=(
+            [
+                "enable-channel",
+                "--session",
+                self.name,
+                "--" + domain_option_name,
+                channel_name,
+                (
                     "--buffers-uid"
                     if buffer_sharing_policy == lttngctl.BufferSharingPolicy.PerUID
                     else "--buffers-pid"
                 ),
-            )
+            ]
         )
         return _Channel(self._client, channel_name, domain, self)
 
@@ -519,19 +584,19 @@ class _Session(lttngctl.Session):
 
     def start(self):
         # type: () -> None
-        self._client._run_cmd("start '{session_name}'".format(session_name=self.name))
+        self._client._run_cmd(["start", self.name])
 
     def stop(self):
         # type: () -> None
-        self._client._run_cmd("stop '{session_name}'".format(session_name=self.name))
+        self._client._run_cmd(["stop", self.name])
 
     def clear(self):
         # type: () -> None
-        self._client._run_cmd("clear '{session_name}'".format(session_name=self.name))
+        self._client._run_cmd(["clear", self.name])
 
     def destroy(self):
         # type: () -> None
-        self._client._run_cmd("destroy '{session_name}'".format(session_name=self.name))
+        self._client._run_cmd(["destroy", self.name])
 
     def rotate(self, wait=True):
         # type: (bool) -> None
@@ -541,8 +606,7 @@ class _Session(lttngctl.Session):
     def is_active(self):
         # type: () -> bool
         list_session_xml = self._client._run_cmd(
-            "list '{session_name}'".format(session_name=self.name),
-            LTTngClient.CommandOutputFormat.MI_XML,
+            ["list", self.name], LTTngClient.CommandOutputFormat.MI_XML
         )
 
         root = xml.etree.ElementTree.fromstring(list_session_xml)
@@ -560,65 +624,79 @@ class _Session(lttngctl.Session):
 
         return enabled_text == "true"
 
+    def _get_process_attribute_tracker(self, attribute, domain):
+        # type: (_ProcessAttribute, lttngctl.TracingDomain) -> _ProcessAttributeTracker
+        key = (attribute, domain)
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = _ProcessAttributeTracker(self._client, attribute, domain, self)
+            self._trackers[key] = tracker
+
+        return tracker
+
     @property
     def kernel_pid_process_attribute_tracker(self):
         # type: () -> Type[lttngctl.ProcessIDProcessAttributeTracker]
-        return _ProcessAttributeTracker(self._client, _ProcessAttribute.PID, lttngctl.TracingDomain.Kernel, self)  # type: ignore
+        return self._get_process_attribute_tracker(_ProcessAttribute.PID, lttngctl.TracingDomain.Kernel)  # type: ignore
 
     @property
     def kernel_vpid_process_attribute_tracker(self):
         # type: () -> Type[lttngctl.VirtualProcessIDProcessAttributeTracker]
-        return _ProcessAttributeTracker(self._client, _ProcessAttribute.VPID, lttngctl.TracingDomain.Kernel, self)  # type: ignore
+        return self._get_process_attribute_tracker(_ProcessAttribute.VPID, lttngctl.TracingDomain.Kernel)  # type: ignore
 
     @property
     def user_vpid_process_attribute_tracker(self):
         # type: () -> Type[lttngctl.VirtualProcessIDProcessAttributeTracker]
-        return _ProcessAttributeTracker(self._client, _ProcessAttribute.VPID, lttngctl.TracingDomain.User, self)  # type: ignore
+        return self._get_process_attribute_tracker(_ProcessAttribute.VPID, lttngctl.TracingDomain.User)  # type: ignore
 
     @property
     def kernel_gid_process_attribute_tracker(self):
         # type: () -> Type[lttngctl.GroupIDProcessAttributeTracker]
-        return _ProcessAttributeTracker(self._client, _ProcessAttribute.GID, lttngctl.TracingDomain.Kernel, self)  # type: ignore
+        return self._get_process_attribute_tracker(_ProcessAttribute.GID, lttngctl.TracingDomain.Kernel)  # type: ignore
 
     @property
     def kernel_vgid_process_attribute_tracker(self):
         # type: () -> Type[lttngctl.VirtualGroupIDProcessAttributeTracker]
-        return _ProcessAttributeTracker(self._client, _ProcessAttribute.VGID, lttngctl.TracingDomain.Kernel, self)  # type: ignore
+        return self._get_process_attribute_tracker(_ProcessAttribute.VGID, lttngctl.TracingDomain.Kernel)  # type: ignore
 
     @property
     def user_vgid_process_attribute_tracker(self):
         # type: () -> Type[lttngctl.VirtualGroupIDProcessAttributeTracker]
-        return _ProcessAttributeTracker(self._client, _ProcessAttribute.VGID, lttngctl.TracingDomain.User, self)  # type: ignore
+        return self._get_process_attribute_tracker(_ProcessAttribute.VGID, lttngctl.TracingDomain.User)  # type: ignore
 
     @property
     def kernel_uid_process_attribute_tracker(self):
         # type: () -> Type[lttngctl.UserIDProcessAttributeTracker]
-        return _ProcessAttributeTracker(self._client, _ProcessAttribute.UID, lttngctl.TracingDomain.Kernel, self)  # type: ignore
+        return self._get_process_attribute_tracker(_ProcessAttribute.UID, lttngctl.TracingDomain.Kernel)  # type: ignore
 
     @property
     def kernel_vuid_process_attribute_tracker(self):
         # type: () -> Type[lttngctl.VirtualUserIDProcessAttributeTracker]
-        return _ProcessAttributeTracker(self._client, _ProcessAttribute.VUID, lttngctl.TracingDomain.Kernel, self)  # type: ignore
+        return self._get_process_attribute_tracker(_ProcessAttribute.VUID, lttngctl.TracingDomain.Kernel)  # type: ignore
 
     @property
     def user_vuid_process_attribute_tracker(self):
         # type: () -> Type[lttngctl.VirtualUserIDProcessAttributeTracker]
-        return _ProcessAttributeTracker(self._client, _ProcessAttribute.VUID, lttngctl.TracingDomain.User, self)  # type: ignore
+        return self._get_process_attribute_tracker(_ProcessAttribute.VUID, lttngctl.TracingDomain.User)  # type: ignore
 
 
 class LTTngClientError(lttngctl.ControlException):
     def __init__(
         self,
-        command_args,  # type: str
+        command_args,  # type: list[str]
         error_output,  # type: str
     ):
-        self._command_args = command_args  # type: str
+        self._command_args = command_args  # type: list[str]
         self._output = error_output  # type: str
 
 
 class LTTngClient(logger._Logger, lttngctl.Controller):
     """
     Implementation of a LTTngCtl Controller that uses the `lttng` client as a back-end.
+
+    Every command spawns a new `lttng` process: this controller is meant to
+    exercise the client itself. A controller wrapping liblttng-ctl directly
+    belongs in a separate implementation of the lttngctl.Controller interface.
     """
 
     class CommandOutputFormat(enum.Enum):
@@ -634,6 +712,8 @@ class LTTngClient(logger._Logger, lttngctl.Controller):
     ):
         logger._Logger.__init__(self, log)
         self._environment = test_environment  # type: environment._Environment
+        self._client_env = os.environ.copy()  # type: dict[str, str]
+        self._client_env["LTTNG_HOME"] = str(self._environment.lttng_home_location)
 
     @staticmethod
     def _namespaced_mi_element(property):
@@ -641,34 +721,33 @@ class LTTngClient(logger._Logger, lttngctl.Controller):
         return LTTngClient._MI_NS + property
 
     def _run_cmd(self, command_args, output_format=CommandOutputFormat.MI_XML):
-        # type: (str, CommandOutputFormat) -> str
+        # type: (list[str], CommandOutputFormat) -> str
         """
-        Invoke the `lttng` client with a set of arguments. The command is
+        Invoke the `lttng` client with a list of arguments. The command is
         executed in the context of the client's test environment.
         """
         args = [str(self._environment.lttng_client_path)]  # type: list[str]
         if output_format == LTTngClient.CommandOutputFormat.MI_XML:
             args.extend(["--mi", "xml"])
 
-        args.extend(shlex.split(command_args))
+        args.extend(command_args)
 
-        self._log("lttng {command_args}".format(command_args=command_args))
-
-        client_env = os.environ.copy()  # type: dict[str, str]
-        client_env["LTTNG_HOME"] = str(self._environment.lttng_home_location)
+        self._log("lttng {command_args}".format(command_args=" ".join(command_args)))
 
         process = subprocess.Popen(
-            args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=client_env
+            args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._client_env
         )
 
-        out = process.communicate()[0]
+        out, err = process.communicate()
 
+        # Only decode the output that is used: the command's output on
+        # success and its error output on failure.
         if process.returncode != 0:
-            decoded_output = out.decode("utf-8")
-            for error_line in decoded_output.splitlines():
+            decoded_error_output = err.decode("utf-8", errors="replace")
+            for error_line in decoded_error_output.splitlines():
                 self._log(error_line)
 
-            raise LTTngClientError(command_args, decoded_output)
+            raise LTTngClientError(command_args, decoded_error_output)
         else:
             return out.decode("utf-8")
 
@@ -677,80 +756,78 @@ class LTTngClient(logger._Logger, lttngctl.Controller):
         name = name if name else lttngctl.Session._generate_name()
 
         if isinstance(output, lttngctl.LocalSessionOutputLocation):
-            output_option = "--output '{output_path}'".format(output_path=output.path)
+            output_option = ["--output", str(output.path)]
         elif isinstance(output, lttngctl.NetworkSessionOutputLocation):
-            output_option = "--set-url '{}'".format(output.url)
+            output_option = ["--set-url", output.url]
         elif output is None:
-            output_option = "--no-output"
+            output_option = ["--no-output"]
         else:
             raise TypeError("LTTngClient only supports local or no output")
 
-        self._run_cmd(
-            "create '{session_name}' {output_option} {live_option}".format(
-                session_name=name,
-                output_option=output_option,
-                live_option="--live" if live else "",
-            )
-        )
+        client_args = ["create", name] + output_option
+        if live:
+            client_args.append("--live")
+
+        self._run_cmd(client_args)
         return _Session(self, name, output)
 
     def start_session_by_name(self, name):
         # type: (str) -> None
-        self._run_cmd("start '{session_name}'".format(session_name=name))
+        self._run_cmd(["start", name])
 
     def start_session_by_glob_pattern(self, pattern):
         # type: (str) -> None
-        self._run_cmd("start --glob '{pattern}'".format(pattern=pattern))
+        self._run_cmd(["start", "--glob", pattern])
 
     def start_sessions_all(self):
         # type: () -> None
-        self._run_cmd("start --all")
+        self._run_cmd(["start", "--all"])
 
     def stop_session_by_name(self, name):
         # type: (str) -> None
-        self._run_cmd("stop '{session_name}'".format(session_name=name))
+        self._run_cmd(["stop", name])
 
     def stop_session_by_glob_pattern(self, pattern):
         # type: (str) -> None
-        self._run_cmd("stop --glob '{pattern}'".format(pattern=pattern))
+        self._run_cmd(["stop", "--glob", pattern])
 
     def stop_sessions_all(self):
         # type: () -> None
-        self._run_cmd("stop --all")
+        self._run_cmd(["stop", "--all"])
 
     def destroy_session_by_name(self, name):
         # type: (str) -> None
-        self._run_cmd("destroy '{session_name}'".format(session_name=name))
+        self._run_cmd(["destroy", name])
 
     def destroy_session_by_glob_pattern(self, pattern):
         # type: (str) -> None
-        self._run_cmd("destroy --glob '{pattern}'".format(pattern=pattern))
+        self._run_cmd(["destroy", "--glob", pattern])
 
     def destroy_sessions_all(self):
         # type: () -> None
-        self._run_cmd("destroy --all")
+        self._run_cmd(["destroy", "--all"])
 
     def rotate_session_by_name(self, name, wait=True):
-        self._run_cmd(
-            "rotate '{session_name}' {wait_option}".format(
-                session_name=name, wait_option="-n" if wait is False else ""
-            )
-        )
+        client_args = ["rotate", name]
+        if wait is False:
+            client_args.append("-n")
+
+        self._run_cmd(client_args)
 
     def schedule_size_based_rotation(self, name, size_bytes):
         # type (str, int) -> None
-        self._run_cmd(
-            "enable-rotation --session '{session_name}' --size {size}".format(
-                session_name=name, size=size_bytes
-            )
-        )
+        self._run_cmd(["enable-rotation", "--session", name, "--size", str(size_bytes)])
 
     def schedule_time_based_rotation(self, name, period_seconds):
         # type (str, int) -> None
         self._run_cmd(
-            "enable-rotation --session '{session_name}' --timer {period_seconds}s".format(
-                session_name=name, period_seconds=period_seconds
-            )
+            [
+                "enable-rotation",
+                "--session",
+                name,
+                "--timer",
+                "{period_seconds}s".format(period_seconds=period_seconds),
+            ]
         )
 
     @staticmethod
@@ -774,7 +851,7 @@ class LTTngClient(logger._Logger, lttngctl.Controller):
     def list_sessions(self):
         # type () -> List[Session]
         list_sessions_xml = self._run_cmd(
-            "list", LTTngClient.CommandOutputFormat.MI_XML
+            ["list"], LTTngClient.CommandOutputFormat.MI_XML
         )
 
         root = xml.etree.ElementTree.fromstring(list_sessions_xml)
@@ -389,6 +389,8 @@ class Channel(abc.ABC):
     associated to a domain and
     """
 
+    __slots__ = ()
+
     @staticmethod
     def _generate_name():
         # type: () -> str
@@ -465,6 +467,8 @@ class ProcessAttributeTracker(abc.ABC):
         def __repr__(self):
             return "<%s.%s>" % (self.__class__.__name__, self.name)
 
+    __slots__ = ("_policy",)
+
     def __init__(self, policy):
         # type: (TrackingPolicy)
         self._policy = policy
@@ -548,6 +552,8 @@ class VirtualGroupIDProcessAttributeTracker(ProcessAttributeTracker):
 
 
 class Session(abc.ABC):
+    __slots__ = ()
+
     @staticmethod
     def _generate_name():
         # type: () -> str